@@ -6,16 +6,202 @@ This script demonstrates classifying Heathrow Airport using the urban_classifier
 Heathrow coordinates: 51.4700° N, 0.4543° W
 """
 
+import collections
+import io
+import os
 import polars as pl
 import sys
 from pathlib import Path
 
-try:
-    import urban_classifier
-except ImportError:
-    print("Error: urban_classifier package not found.")
-    print("Make sure you've built the package with: maturin develop --features python")
-    sys.exit(1)
+# Claim a larger block cache than the shared default before _common applies
+# its GDAL env defaults: this demo hammers random point queries. setdefault
+# keeps values already exported in the environment in charge.
+os.environ.setdefault("GDAL_CACHEMAX", "2048")
+
+from _common import ensure_overviews, get_classifier
+
+
+def _lazy_import():
+    """Import the urban_classifier extension on first use.
+
+    Raising instead of calling sys.exit keeps the module importable for
+    reuse (e.g. a benchmark harness driving several demos in one
+    interpreter); the CLI entry point turns the error into an exit code.
+    """
+    try:
+        import urban_classifier
+    except ImportError as e:
+        raise RuntimeError(
+            "urban_classifier package not found. "
+            "Build it with: maturin develop --features python"
+        ) from e
+    return urban_classifier
+
+
+# Interpretation text for the LCZ codes expected at airports, with fallbacks
+# keyed by simplified category. Fallback headlines are format templates that
+# take the LCZ name.
+_INTERPRETATIONS = {
+    8: (
+        "✈️  Large low-rise (LCZ 8) - This is EXPECTED for airports!",
+        "   • Airports typically classified as 'Large low-rise'",
+        "   • Large buildings (terminals) with extensive open areas (runways)",
+        "   • Low building density but large building footprints",
+    ),
+    9: (
+        "🏘️  Sparsely built (LCZ 9) - Also common for airports",
+        "   • Few buildings with extensive open paved areas",
+        "   • Runways and taxiways create large impervious surfaces",
+    ),
+    15: (
+        "🛣️  Bare rock or paved (LCZ 15) - Airport infrastructure",
+        "   • Dominated by paved surfaces (runways, taxiways, aprons)",
+        "   • Minimal vegetation or buildings in the classification area",
+    ),
+}
+
+_CATEGORY_FALLBACK = {
+    "Urban": (
+        "🏙️  Urban classification: {lcz_name}",
+        "   • Airport is in or adjacent to urban development",
+        "   • Likely influenced by surrounding built environment",
+    ),
+    "Suburban": (
+        "🏘️  Suburban classification: {lcz_name}",
+        "   • Airport has suburban characteristics",
+        "   • Mixed development with moderate building density",
+    ),
+    "Rural": (
+        "🌳 Rural classification: {lcz_name}",
+        "   • Unexpected for Heathrow - may indicate data resolution limits",
+        "   • Could be sampling a less developed area near the airport",
+    ),
+}
+
+# Candidate locations for the WUDAPT GeoTIFF, in priority order. The cache
+# path is hoisted here so Path.home() is not recomputed on every invocation.
+_CACHE_WUDAPT_PATH = (
+    Path.home() / ".cache" / "urban_classifier" / "wudapt_lcz_global.tif"
+)
+_WUDAPT_PATHS = (
+    Path("wudapt_lcz_global.tif"),
+    Path("data/wudapt_lcz_global.tif"),
+    Path("../data/wudapt_lcz_global.tif"),
+    Path("/tmp/wudapt_lcz_global.tif"),
+    _CACHE_WUDAPT_PATH,
+)
+
+
+# Optional remote Cloud-Optimized GeoTIFF source. When set, GDAL reads only
+# the 512x512 tiles covering the query points via HTTP range requests
+# instead of needing the full 4 GB file locally. Convert with:
+#   gdal_translate wudapt_lcz_global.tif wudapt_lcz_global_cog.tif \
+#       -of COG -co BLOCKSIZE=512 -co COMPRESS=DEFLATE
+_COG_URL = os.environ.get("WUDAPT_COG_URL")
+
+# Little- and big-endian TIFF magic numbers
+_TIFF_MAGICS = (b"II*\x00", b"MM\x00*")
+
+
+def _has_tiff_magic(path):
+    """Check the 4-byte TIFF magic, catching corrupt files before GDAL does."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(4) in _TIFF_MAGICS
+    except OSError:
+        return False
+
+
+def _find_wudapt_file():
+    """Locate a complete WUDAPT GeoTIFF among the candidate paths.
+
+    Candidates are grouped by parent directory and probed with one
+    os.scandir sweep per parent, which fetches name and size together
+    instead of issuing two stat calls per candidate path.
+    """
+    # A remote COG takes priority: no local stat or magic check applies,
+    # GDAL issues HTTP range reads for just the tiles it needs
+    if _COG_URL:
+        os.environ.setdefault("GDAL_HTTP_MULTIPLEX", "YES")
+        return f"/vsicurl/{_COG_URL}"
+
+    by_parent = collections.defaultdict(set)
+    for candidate in _WUDAPT_PATHS:
+        by_parent[candidate.parent].add(candidate.name)
+
+    sizes = {}
+    for parent, names in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        sizes[parent / entry.name] = entry.stat().st_size
+        except FileNotFoundError:
+            continue
+
+    for candidate in _WUDAPT_PATHS:
+        size = sizes.get(candidate)
+        if size is None:
+            continue
+        if size <= 3_000_000_000:  # At least 3GB (should be ~4GB)
+            print(
+                f"⚠️  Found {candidate} but it's too small ({size/1e9:.1f}GB) - likely incomplete"
+            )
+            continue
+        if not _has_tiff_magic(candidate):
+            print(f"⚠️  Found {candidate} but it's not a valid TIFF - likely corrupt")
+            continue
+        return str(candidate)
+
+    return None
+
+
+# Primed mappings are kept alive here so the pages stay referenced for the
+# lifetime of the process
+_PRIMED_MMAPS = {}
+
+
+def _prime_cache(path):
+    """Prime the OS page cache for the WUDAPT file ahead of random sampling.
+
+    Hints the kernel with posix_fadvise(WILLNEED) where available, then maps
+    the file and touches one byte per 64 KiB to pull it into the page cache,
+    so subsequent GDAL block reads hit RAM instead of disk.
+    """
+    if path in _PRIMED_MMAPS:
+        return
+    import mmap
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        size = os.fstat(fd).st_size
+        mm = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+    for offset in range(0, size, 65536):
+        _ = mm[offset]
+
+    _PRIMED_MMAPS[path] = mm
+
+
+def _attach_lcz_columns(df, codes):
+    """Join lcz_code/lcz_name/simple_class columns onto df for the given codes."""
+    lcz_info = _lazy_import().PyUrbanClassifier.get_lcz_info()
+    lookup = pl.DataFrame(
+        {
+            "lcz_code": pl.Series(
+                [int(code) for code in lcz_info["codes"]], dtype=pl.UInt32
+            ),
+            "lcz_name": lcz_info["names"],
+            "simple_class": lcz_info["categories"],
+        }
+    )
+    return df.with_columns(pl.Series("lcz_code", codes, dtype=pl.UInt32)).join(
+        lookup, on="lcz_code", how="left"
+    )
 
 
 def classify_heathrow():
@@ -26,18 +212,29 @@ def classify_heathrow():
     - Latitude: 51.4700° N
     - Longitude: 0.4543° W (which is -0.4543° in decimal degrees)
     """
-    print("🛬 Heathrow Airport LCZ Classification")
-    print("=====================================")
-    print()
+    # Buffer the whole report and emit it with one write: a single stdout
+    # write replaces ~60 individually locked and flushed print calls
+    out = io.StringIO()
+    try:
+        return _classify_heathrow(out)
+    finally:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+
+
+def _classify_heathrow(out):
+    print("🛬 Heathrow Airport LCZ Classification", file=out)
+    print("=====================================", file=out)
+    print(file=out)
 
     # Heathrow Airport coordinates
     heathrow_lat = 51.4700
     heathrow_lon = -0.4543  # West longitude is negative
 
-    print("📍 Location: Heathrow Airport, London, UK")
-    print(f"🌐 Coordinates: {heathrow_lat}°N, {abs(heathrow_lon)}°W")
-    print(f"🔢 Decimal: ({heathrow_lat}, {heathrow_lon})")
-    print()
+    print("📍 Location: Heathrow Airport, London, UK", file=out)
+    print(f"🌐 Coordinates: {heathrow_lat}°N, {abs(heathrow_lon)}°W", file=out)
+    print(f"🔢 Decimal: ({heathrow_lat}, {heathrow_lon})", file=out)
+    print(file=out)
 
     # Create DataFrame with Heathrow data
     df = pl.DataFrame(
@@ -53,161 +250,119 @@ def classify_heathrow():
         }
     )
 
-    print("Input DataFrame:")
-    print(df)
-    print()
+    print("Input DataFrame:", file=out)
+    print(df, file=out)
+    print(file=out)
 
     # Look for WUDAPT file
-    wudapt_paths = [
-        "wudapt_lcz_global.tif",
-        "data/wudapt_lcz_global.tif",
-        "../data/wudapt_lcz_global.tif",
-        "/tmp/wudapt_lcz_global.tif",
-        str(Path.home() / ".cache" / "urban_classifier" / "wudapt_lcz_global.tif"),
-    ]
-
-    wudapt_file = None
-    for path in wudapt_paths:
-        if Path(path).exists():
-            file_size = Path(path).stat().st_size
-            if file_size > 3_000_000_000:  # At least 3GB (should be ~4GB)
-                wudapt_file = path
-                break
-            else:
-                print(
-                    f"⚠️  Found {path} but it's too small ({file_size/1e9:.1f}GB) - likely incomplete"
-                )
+    wudapt_file = _find_wudapt_file()
 
     if wudapt_file:
-        print(f"✅ Found complete WUDAPT file: {wudapt_file}")
-        file_size_gb = Path(wudapt_file).stat().st_size / 1e9
-        print(f"📊 File size: {file_size_gb:.1f} GB")
-        print()
-        print("🔍 Running classification...")
+        print(f"✅ Found complete WUDAPT file: {wudapt_file}", file=out)
+        if not wudapt_file.startswith("/vsicurl/"):
+            file_size_gb = Path(wudapt_file).stat().st_size / 1e9
+            print(f"📊 File size: {file_size_gb:.1f} GB", file=out)
+            ensure_overviews(wudapt_file)
+            _prime_cache(wudapt_file)
+        print(file=out)
+        print("🔍 Running classification...", file=out)
+
+        # Deferred import: the GDAL-linked extension module only loads when
+        # a classification will actually run
+        _lazy_import()
 
         try:
-            # Initialize classifier
-            classifier = urban_classifier.PyUrbanClassifier(wudapt_file)
-
-            # Perform classification
-            result_df = classifier.run_classification(
-                df,
-                station_id_col="station_id",
-                lon_col="longitude",
-                lat_col="latitude",
-                overrides=None,
-            )
-
-            print("🎯 CLASSIFICATION RESULTS:")
-            print("=" * 50)
-            print(result_df)
-            print()
-
-            # Extract and interpret the results
-            lcz_code = result_df["lcz_code"][0]
-            lcz_name = result_df["lcz_name"][0]
-            simple_class = result_df["simple_class"][0]
-
-            print("📋 HEATHROW AIRPORT CLASSIFICATION:")
-            print("-" * 35)
-            print(f"🏷️  LCZ Code: {lcz_code}")
-            print(f"📝 LCZ Name: {lcz_name}")
-            print(f"🏙️  Category: {simple_class}")
-            print()
+            # Initialize classifier (shared process-lifetime handle)
+            classifier = get_classifier(wudapt_file)
+
+            # Gather all coordinates into one contiguous float64 array so the
+            # whole batch crosses the Python/Rust boundary in a single call
+            coords = df.select([pl.col("longitude"), pl.col("latitude")]).to_numpy()
+            codes = classifier.classify_points(coords)
+            result_df = _attach_lcz_columns(df, codes)
+
+            print("🎯 CLASSIFICATION RESULTS:", file=out)
+            print("=" * 50, file=out)
+            print(result_df, file=out)
+            print(file=out)
+
+            # Extract and interpret the results in a single row scan
+            row = result_df.row(0, named=True)
+            lcz_code = row["lcz_code"]
+            lcz_name = row["lcz_name"]
+            simple_class = row["simple_class"]
+
+            print("📋 HEATHROW AIRPORT CLASSIFICATION:", file=out)
+            print("-" * 35, file=out)
+            print(f"🏷️  LCZ Code: {lcz_code}", file=out)
+            print(f"📝 LCZ Name: {lcz_name}", file=out)
+            print(f"🏙️  Category: {simple_class}", file=out)
+            print(file=out)
 
             # Provide interpretation
-            print("🧠 INTERPRETATION:")
-            print("-" * 17)
-
-            if lcz_code == 8:
-                print("✈️  Large low-rise (LCZ 8) - This is EXPECTED for airports!")
-                print("   • Airports typically classified as 'Large low-rise'")
-                print(
-                    "   • Large buildings (terminals) with extensive open areas (runways)"
-                )
-                print("   • Low building density but large building footprints")
-
-            elif lcz_code == 9:
-                print("🏘️  Sparsely built (LCZ 9) - Also common for airports")
-                print("   • Few buildings with extensive open paved areas")
-                print("   • Runways and taxiways create large impervious surfaces")
-
-            elif lcz_code == 15:
-                print("🛣️  Bare rock or paved (LCZ 15) - Airport infrastructure")
-                print("   • Dominated by paved surfaces (runways, taxiways, aprons)")
-                print("   • Minimal vegetation or buildings in the classification area")
-
-            elif simple_class == "Urban":
-                print(f"🏙️  Urban classification: {lcz_name}")
-                print("   • Airport is in or adjacent to urban development")
-                print("   • Likely influenced by surrounding built environment")
-
-            elif simple_class == "Suburban":
-                print(f"🏘️  Suburban classification: {lcz_name}")
-                print("   • Airport has suburban characteristics")
-                print("   • Mixed development with moderate building density")
+            print("🧠 INTERPRETATION:", file=out)
+            print("-" * 17, file=out)
 
-            else:
-                print(f"🌳 Rural classification: {lcz_name}")
-                print(
-                    "   • Unexpected for Heathrow - may indicate data resolution limits"
-                )
-                print("   • Could be sampling a less developed area near the airport")
+            lines = _INTERPRETATIONS.get(
+                lcz_code,
+                _CATEGORY_FALLBACK.get(simple_class, _CATEGORY_FALLBACK["Rural"]),
+            )
+            print("\n".join(lines).format(lcz_name=lcz_name), file=out)
 
-            print()
-            print("🌡️  CLIMATE IMPLICATIONS:")
-            print("-" * 22)
+            print(file=out)
+            print("🌡️  CLIMATE IMPLICATIONS:", file=out)
+            print("-" * 22, file=out)
 
             if simple_class in ["Urban", "Suburban"]:
-                print("• Moderate to significant urban heat island effect")
-                print("• Airport infrastructure contributes to local warming")
-                print("• Large paved areas absorb and re-radiate heat")
-                print("• Reduced evapotranspiration compared to natural surfaces")
+                print("• Moderate to significant urban heat island effect", file=out)
+                print("• Airport infrastructure contributes to local warming", file=out)
+                print("• Large paved areas absorb and re-radiate heat", file=out)
+                print("• Reduced evapotranspiration compared to natural surfaces", file=out)
             else:
-                print("• Minimal urban heat island effect")
-                print("• Temperature patterns influenced by land surface properties")
+                print("• Minimal urban heat island effect", file=out)
+                print("• Temperature patterns influenced by land surface properties", file=out)
 
-            print()
-            print("📚 AIRPORT CONTEXT:")
-            print("-" * 17)
-            print("• Heathrow is one of the world's busiest airports")
-            print("• Massive infrastructure: 2 runways, 5 terminals")
-            print("• Located in Greater London urban area")
-            print("• Airport operations can influence local microclimate")
+            print(file=out)
+            print("📚 AIRPORT CONTEXT:", file=out)
+            print("-" * 17, file=out)
+            print("• Heathrow is one of the world's busiest airports", file=out)
+            print("• Massive infrastructure: 2 runways, 5 terminals", file=out)
+            print("• Located in Greater London urban area", file=out)
+            print("• Airport operations can influence local microclimate", file=out)
 
             return result_df
 
         except Exception as e:
-            print(f"❌ Classification failed: {e}")
-            print()
-            print("🔧 Possible issues:")
-            print("• File may be corrupted or incomplete")
-            print("• GDAL library issues")
-            print("• Coordinate transformation problems")
-            print()
-            print("💡 Try re-downloading the WUDAPT data:")
-            print("   ./target/release/download_wudapt --force")
+            print(f"❌ Classification failed: {e}", file=out)
+            print(file=out)
+            print("🔧 Possible issues:", file=out)
+            print("• File may be corrupted or incomplete", file=out)
+            print("• GDAL library issues", file=out)
+            print("• Coordinate transformation problems", file=out)
+            print(file=out)
+            print("💡 Try re-downloading the WUDAPT data:", file=out)
+            print("   ./target/release/download_wudapt --force", file=out)
             return None
     else:
-        print("❌ No complete WUDAPT GeoTIFF file found.")
-        print()
-        print("📥 To download the Global LCZ Map:")
-        print("   ./target/release/download_wudapt")
-        print()
-        print("📊 Expected file size: ~4GB")
-        print("⏱️  Download time: 10-60 minutes")
-        print()
+        print("❌ No complete WUDAPT GeoTIFF file found.", file=out)
+        print(file=out)
+        print("📥 To download the Global LCZ Map:", file=out)
+        print("   ./target/release/download_wudapt", file=out)
+        print(file=out)
+        print("📊 Expected file size: ~4GB", file=out)
+        print("⏱️  Download time: 10-60 minutes", file=out)
+        print(file=out)
 
         # Show what we expect for Heathrow
-        print("🔮 EXPECTED CLASSIFICATION FOR HEATHROW:")
-        print("-" * 42)
-        print("Most likely: LCZ 8 (Large low-rise) or LCZ 9 (Sparsely built)")
-        print("Category: Suburban")
-        print("Reasoning:")
-        print("• Airports have large buildings (terminals) with low density")
-        print("• Extensive paved areas (runways, taxiways)")
-        print("• Mix of built and open impervious surfaces")
-        print("• Heathrow's massive scale fits 'Large low-rise' pattern")
+        print("🔮 EXPECTED CLASSIFICATION FOR HEATHROW:", file=out)
+        print("-" * 42, file=out)
+        print("Most likely: LCZ 8 (Large low-rise) or LCZ 9 (Sparsely built)", file=out)
+        print("Category: Suburban", file=out)
+        print("Reasoning:", file=out)
+        print("• Airports have large buildings (terminals) with low density", file=out)
+        print("• Extensive paved areas (runways, taxiways)", file=out)
+        print("• Mix of built and open impervious surfaces", file=out)
+        print("• Heathrow's massive scale fits 'Large low-rise' pattern", file=out)
 
         return None
 
@@ -234,4 +389,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except RuntimeError as e:
+        print(e)
+        sys.exit(1)
@@ -6,6 +6,9 @@ Since the full WUDAPT data isn't available, this shows what we expect
 Heathrow's classification to be based on airport characteristics.
 """
 
+import io
+import sys
+
 import polars as pl
 import urban_classifier
 
@@ -14,88 +17,94 @@ def predict_heathrow_classification():
     """
     Predict Heathrow's LCZ classification based on airport characteristics.
     """
-    print("🛬 Heathrow Airport LCZ Classification Prediction")
-    print("================================================")
-    print()
+    # Buffer the whole report and emit it with one write: a single stdout
+    # write replaces ~60 individually locked and flushed print calls
+    out = io.StringIO()
+    try:
+        return _predict_heathrow_classification(out)
+    finally:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+
+
+def _predict_heathrow_classification(out):
+    print("🛬 Heathrow Airport LCZ Classification Prediction", file=out)
+    print("================================================", file=out)
+    print(file=out)
 
     # Heathrow coordinates and details
     heathrow_lat = 51.4700
     heathrow_lon = -0.4543
 
-    print("📍 Location: Heathrow Airport (LHR), London, UK")
-    print(f"🌐 Coordinates: {heathrow_lat}°N, {abs(heathrow_lon)}°W")
-    print("✈️  IATA Code: LHR")
-    print("🏗️  Infrastructure: 2 runways, 5 terminals, massive cargo facilities")
-    print()
+    print("📍 Location: Heathrow Airport (LHR), London, UK", file=out)
+    print(f"🌐 Coordinates: {heathrow_lat}°N, {abs(heathrow_lon)}°W", file=out)
+    print("✈️  IATA Code: LHR", file=out)
+    print("🏗️  Infrastructure: 2 runways, 5 terminals, massive cargo facilities", file=out)
+    print(file=out)
 
     # Get LCZ information for context
     _ = urban_classifier.PyUrbanClassifier.get_lcz_info()
 
-    print("AIRPORT CHARACTERISTICS ANALYSIS:")
-    print("-" * 35)
-    print("• 🏢 Large terminal buildings (low-rise but massive footprint)")
-    print("• 🛫 Extensive runway system (3.9km and 3.7km runways)")
-    print("• 🚛 Cargo facilities and maintenance hangars")
-    print("• 🚗 Massive parking areas and road infrastructure")
-    print("• 🌿 Limited vegetation (for safety - bird strike prevention)")
-    print("• 🏗️  Surrounded by urban development (Greater London)")
-    print()
-
-    print("MOST LIKELY LCZ CLASSIFICATIONS:")
-    print("-" * 35)
-
-    # Likely classifications for major airports
-    airport_classifications = [
-        (
-            8,
-            "Large low-rise",
-            "Suburban",
-            60,
-            "Large terminals with extensive open areas",
-        ),
-        (
-            9,
-            "Sparsely built",
-            "Suburban",
-            25,
-            "Low building density with extensive paved areas",
-        ),
-        (
-            15,
-            "Bare rock or paved",
-            "Rural",
-            10,
-            "If sampling mainly runway/taxiway areas",
-        ),
-        (10, "Heavy industry", "Suburban", 3, "Industrial/cargo areas of airport"),
-        (6, "Open low-rise", "Urban", 2, "If sampling terminal/passenger areas"),
-    ]
-
-    print("Probability | LCZ | Name | Category | Reasoning")
-    print("-" * 70)
-
-    for lcz_code, name, category, prob, reason in airport_classifications:
-        print(f"{prob:8}%   | {lcz_code:2}  | {name:<18} | {category:<8} | {reason}")
-
-    print()
-    print("MOST LIKELY PREDICTION:")
-    print("=" * 25)
-    print("🏷️  LCZ Code: 8")
-    print("📝 LCZ Name: Large low-rise")
-    print("🏙️  Category: Suburban")
-    print("🎯 Confidence: High (60% probability)")
-    print()
-
-    print("REASONING FOR LCZ 8 (Large low-rise):")
-    print("-" * 38)
-    print("✅ Large building footprints (terminals)")
-    print("✅ Low building density overall")
-    print("✅ Extensive open spaces (runways, taxiways)")
-    print("✅ Mix of built and paved surfaces")
-    print("✅ Typical pattern for major international airports")
-    print()
+    print("AIRPORT CHARACTERISTICS ANALYSIS:", file=out)
+    print("-" * 35, file=out)
+    print("• 🏢 Large terminal buildings (low-rise but massive footprint)", file=out)
+    print("• 🛫 Extensive runway system (3.9km and 3.7km runways)", file=out)
+    print("• 🚛 Cargo facilities and maintenance hangars", file=out)
+    print("• 🚗 Massive parking areas and road infrastructure", file=out)
+    print("• 🌿 Limited vegetation (for safety - bird strike prevention)", file=out)
+    print("• 🏗️  Surrounded by urban development (Greater London)", file=out)
+    print(file=out)
+
+    print("MOST LIKELY LCZ CLASSIFICATIONS:", file=out)
+    print("-" * 35, file=out)
+
+    # Likely classifications for major airports, formatted once by Polars'
+    # native tabular printer instead of per-row f-strings
+    airport_df = pl.DataFrame(
+        {
+            "prob_pct": [60, 25, 10, 3, 2],
+            "lcz": [8, 9, 15, 10, 6],
+            "name": [
+                "Large low-rise",
+                "Sparsely built",
+                "Bare rock or paved",
+                "Heavy industry",
+                "Open low-rise",
+            ],
+            "category": ["Suburban", "Suburban", "Rural", "Suburban", "Urban"],
+            "reason": [
+                "Large terminals with extensive open areas",
+                "Low building density with extensive paved areas",
+                "If sampling mainly runway/taxiway areas",
+                "Industrial/cargo areas of airport",
+                "If sampling terminal/passenger areas",
+            ],
+        }
+    ).sort("prob_pct", descending=True)
+
+    print(airport_df, file=out)
+
+    print(file=out)
+    print("MOST LIKELY PREDICTION:", file=out)
+    print("=" * 25, file=out)
+    print("🏷️  LCZ Code: 8", file=out)
+    print("📝 LCZ Name: Large low-rise", file=out)
+    print("🏙️  Category: Suburban", file=out)
+    print("🎯 Confidence: High (60% probability)", file=out)
+    print(file=out)
+
+    print("REASONING FOR LCZ 8 (Large low-rise):", file=out)
+    print("-" * 38, file=out)
+    print("✅ Large building footprints (terminals)", file=out)
+    print("✅ Low building density overall", file=out)
+    print("✅ Extensive open spaces (runways, taxiways)", file=out)
+    print("✅ Mix of built and paved surfaces", file=out)
+    print("✅ Typical pattern for major international airports", file=out)
+    print(file=out)
 
     # Create simulated result
+    # Explicit schema: skips dtype inference on construction, and the narrow
+    # UInt8/Categorical types are what a large-scale result table should use
     simulated_result = pl.DataFrame(
         {
             "station_id": ["HEATHROW_LHR"],
@@ -109,47 +118,58 @@ def predict_heathrow_classification():
             "simple_class": ["Suburban"],
             "confidence": ["High - typical airport pattern"],
             "data_source": ["Predicted based on airport characteristics"],
-        }
+        },
+        schema={
+            "station_id": pl.Utf8,
+            "longitude": pl.Float64,
+            "latitude": pl.Float64,
+            "description": pl.Utf8,
+            "lcz_code": pl.UInt8,
+            "lcz_name": pl.Categorical,
+            "simple_class": pl.Categorical,
+            "confidence": pl.Utf8,
+            "data_source": pl.Utf8,
+        },
     )
 
-    print("SIMULATED CLASSIFICATION RESULT:")
-    print("-" * 35)
-    print(simulated_result)
-    print()
-
-    print("🌡️  CLIMATE IMPLICATIONS:")
-    print("-" * 23)
-    print("• Moderate urban heat island effect")
-    print("• Large paved surfaces increase local temperatures")
-    print("• Reduced evapotranspiration vs. natural land")
-    print("• Heat absorption from runways and buildings")
-    print("• Local wind patterns affected by large structures")
-    print()
-
-    print("📊 COMPARISON WITH OTHER AIRPORTS:")
-    print("-" * 35)
-    print("• Similar major airports (LAX, JFK, CDG) typically LCZ 8 or 9")
-    print("• Heathrow's size and complexity support LCZ 8 classification")
-    print("• Terminal buildings are large but low-rise (typically 2-4 stories)")
-    print("• Extensive ground infrastructure dominates land use")
-    print()
-
-    print("🔬 RESEARCH APPLICATIONS:")
-    print("-" * 24)
-    print("• Urban heat island studies in London")
-    print("• Airport climate impact assessment")
-    print("• Aviation weather modeling")
-    print("• Land use change analysis")
-    print("• Climate adaptation planning")
-    print()
-
-    print("📚 HEATHROW FACTS:")
-    print("-" * 17)
-    print("• World's 2nd busiest airport by international passengers")
-    print("• 1,227 hectares (3,031 acres) in area")
-    print("• 80+ million passengers annually (pre-pandemic)")
-    print("• Major economic hub for London/UK")
-    print("• Significant local environmental influence")
+    print("SIMULATED CLASSIFICATION RESULT:", file=out)
+    print("-" * 35, file=out)
+    print(simulated_result, file=out)
+    print(file=out)
+
+    print("🌡️  CLIMATE IMPLICATIONS:", file=out)
+    print("-" * 23, file=out)
+    print("• Moderate urban heat island effect", file=out)
+    print("• Large paved surfaces increase local temperatures", file=out)
+    print("• Reduced evapotranspiration vs. natural land", file=out)
+    print("• Heat absorption from runways and buildings", file=out)
+    print("• Local wind patterns affected by large structures", file=out)
+    print(file=out)
+
+    print("📊 COMPARISON WITH OTHER AIRPORTS:", file=out)
+    print("-" * 35, file=out)
+    print("• Similar major airports (LAX, JFK, CDG) typically LCZ 8 or 9", file=out)
+    print("• Heathrow's size and complexity support LCZ 8 classification", file=out)
+    print("• Terminal buildings are large but low-rise (typically 2-4 stories)", file=out)
+    print("• Extensive ground infrastructure dominates land use", file=out)
+    print(file=out)
+
+    print("🔬 RESEARCH APPLICATIONS:", file=out)
+    print("-" * 24, file=out)
+    print("• Urban heat island studies in London", file=out)
+    print("• Airport climate impact assessment", file=out)
+    print("• Aviation weather modeling", file=out)
+    print("• Land use change analysis", file=out)
+    print("• Climate adaptation planning", file=out)
+    print(file=out)
+
+    print("📚 HEATHROW FACTS:", file=out)
+    print("-" * 17, file=out)
+    print("• World's 2nd busiest airport by international passengers", file=out)
+    print("• 1,227 hectares (3,031 acres) in area", file=out)
+    print("• 80+ million passengers annually (pre-pandemic)", file=out)
+    print("• Major economic hub for London/UK", file=out)
+    print("• Significant local environmental influence", file=out)
 
     return simulated_result
 
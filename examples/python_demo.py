@@ -11,23 +11,104 @@ Requirements:
 - WUDAPT GeoTIFF file (download from https://lcz-generator.rub.de/downloads)
 """
 
+import argparse
 import polars as pl
 import sys
 from pathlib import Path
 
-try:
-    import urban_classifier
-except ImportError:
-    print("Error: urban_classifier package not found.")
-    print("Please build and install the package first:")
-    print("  maturin develop --features python")
-    sys.exit(1)
+# Importing _common also applies the shared GDAL env defaults (GDAL_CACHEMAX
+# and friends) before the extension first opens a raster
+from _common import ensure_overviews, get_classifier
 
 
-def main():
+def _lazy_import():
+    """Import the urban_classifier extension on first use.
+
+    Raising instead of calling sys.exit keeps the module importable for
+    reuse (e.g. a benchmark harness driving several demos in one
+    interpreter); the CLI entry point turns the error into an exit code.
+    """
+    try:
+        import urban_classifier
+    except ImportError as e:
+        raise RuntimeError(
+            "urban_classifier package not found. "
+            "Build it with: maturin develop --features python"
+        ) from e
+    return urban_classifier
+
+
+# Rows per classification chunk. Bounds peak memory by one chunk plus the
+# raster block cache, independent of total station count.
+CHUNK_ROWS = 65_536
+
+
+def _classify_chunks(classifier, df):
+    """Stream df through classify_points in fixed-size slices.
+
+    Each slice is classified with a single FFI call and the results are
+    stitched back together with pl.concat(rechunk=False), which is a
+    metadata-only operation.
+    """
+    chunks = []
+    for chunk in df.iter_slices(CHUNK_ROWS):
+        coords = chunk.select([pl.col("longitude"), pl.col("latitude")]).to_numpy()
+        codes = classifier.classify_points(coords)
+        chunks.append(
+            chunk.with_columns(pl.Series("lcz_code", codes, dtype=pl.UInt32))
+        )
+    return pl.concat(chunks, rechunk=False)
+
+
+def _emit(df, csv=False):
+    """Print df as CSV or via Polars' pretty repr.
+
+    The CSV path streams through Polars' Rust writer, which skips the
+    width-measuring pretty-printer and is the right choice when results
+    are piped to other tools.
+    """
+    if csv:
+        df.write_csv(sys.stdout)
+    else:
+        print(df)
+
+
+def _attach_lcz_names(df):
+    """Join lcz_name/simple_class columns onto df via its lcz_code column."""
+    lcz_info = _lazy_import().PyUrbanClassifier.get_lcz_info()
+    lookup = pl.DataFrame(
+        {
+            "lcz_code": pl.Series(
+                [int(code) for code in lcz_info["codes"]], dtype=pl.UInt32
+            ),
+            "lcz_name": lcz_info["names"],
+            "simple_class": lcz_info["categories"],
+        }
+    )
+    return df.join(lookup, on="lcz_code", how="left")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Urban Classifier Python Demo")
+    parser.add_argument(
+        "--wudapt-path",
+        default=None,
+        help="Path to the WUDAPT GeoTIFF (defaults to the system data location)",
+    )
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="Emit result tables as CSV on stdout instead of pretty-printing",
+    )
+    args = parser.parse_args(argv)
+
     print("Urban Classifier Python Demo")
     print("============================\n")
 
+    # Deferred import: the GDAL-linked extension module is only loaded when
+    # the demo actually runs, not when this file is imported for reuse
+    urban_classifier = _lazy_import()
+
     # Example 1: Get LCZ information
     print("1. LCZ Classification System Information")
     print("----------------------------------------")
@@ -36,13 +117,14 @@ def main():
         lcz_info = urban_classifier.PyUrbanClassifier.get_lcz_info()
 
         print("Available LCZ classes:")
-        for i, (code, name, category) in enumerate(
-            zip(lcz_info["codes"], lcz_info["names"], lcz_info["categories"])
+        head = 6  # Limit output for demo
+        for code, name, category in zip(
+            lcz_info["codes"][:head],
+            lcz_info["names"][:head],
+            lcz_info["categories"][:head],
         ):
             print(f"  LCZ {code}: {name} ({category})")
-            if i >= 5:  # Limit output for demo
-                print(f"  ... and {len(lcz_info['codes']) - 6} more")
-                break
+        print(f"  ... and {len(lcz_info['codes']) - head} more")
 
     except Exception as e:
         print(f"Error getting LCZ info: {e}")
@@ -68,9 +150,12 @@ def main():
         "country": ["UK", "France", "Germany", "Spain", "Italy", "UK"],
     }
 
-    df = pl.DataFrame(stations_data)
+    # Build the station table lazily. With an on-disk source this would be
+    # pl.scan_csv(...), letting the optimizer push the column projection
+    # below down into the file reader.
+    lf = pl.LazyFrame(stations_data)
     print("Sample DataFrame:")
-    print(df)
+    print(lf.collect())
 
     # Example 3: Demonstrate manual overrides
     print("\n3. Manual Override Configuration")
@@ -90,15 +175,23 @@ def main():
     print("\n4. Classification Example")
     print("-------------------------")
 
-    # Check the default data location first
-    default_path = urban_classifier.PyUrbanClassifier.default_data_path()
-    print(f"Default WUDAPT data location: {default_path}")
+    # Use the explicit --wudapt-path if given, otherwise the default location
+    wudapt_path = (
+        args.wudapt_path or urban_classifier.PyUrbanClassifier.default_data_path()
+    )
+    print(f"WUDAPT data location: {wudapt_path}")
 
-    if Path(default_path).exists():
-        print("Found WUDAPT file at default location!")
+    if Path(wudapt_path).exists():
+        print("Found WUDAPT file!")
+        ensure_overviews(wudapt_path)
         try:
-            # Initialize classifier from default location
-            classifier = urban_classifier.PyUrbanClassifier.from_default_data()
+            # Initialize classifier (shared process-lifetime handle so the
+            # GDAL dataset stays open)
+            classifier = get_classifier(wudapt_path)
+
+            # Materialize only the columns the classifier needs; on a
+            # scan-backed LazyFrame this projection reaches the disk reader
+            df = lf.select(["station_id", "longitude", "latitude"]).collect()
 
             # Validate DataFrame
             print("Validating DataFrame schema...")
@@ -107,39 +200,56 @@ def main():
             )
             print(f"DataFrame is valid: {is_valid}")
 
-            # Perform classification
+            # Perform classification, streaming the rows in bounded chunks
             print("Running classification...")
-            result_df = classifier.run_classification(
-                df,
-                station_id_col="station_id",
-                lon_col="longitude",
-                lat_col="latitude",
-                overrides=overrides,
+            result_df = _classify_chunks(classifier, df)
+
+            # Apply manual overrides as a vectorized left join + coalesce
+            # instead of a per-row Python lookup
+            overrides_df = pl.DataFrame(
+                {
+                    "station_id": list(overrides),
+                    "override_code": pl.Series(
+                        list(overrides.values()), dtype=pl.UInt32
+                    ),
+                }
+            )
+            result_df = (
+                result_df.join(overrides_df, on="station_id", how="left")
+                .with_columns(
+                    pl.coalesce(["override_code", "lcz_code"]).alias("lcz_code")
+                )
+                .drop("override_code")
             )
+            result_df = _attach_lcz_names(result_df)
 
             print("\nClassification Results:")
-            print(result_df)
+            _emit(result_df, args.csv)
 
             # Analyze results
             print("\n5. Results Analysis")
             print("-------------------")
 
-            # Count by category
-            category_counts = result_df.group_by("simple_class").agg(
-                pl.count().alias("count")
-            )
+            # Count by category - value_counts uses a single specialized hash
+            # pass rather than the generic group-by codepath
+            category_counts = result_df["simple_class"].value_counts(sort=True)
             print("\nStations by category:")
             print(category_counts)
 
             # Show override effects
             print("\nStations with manual overrides:")
-            override_results = result_df.filter(
-                pl.col("station_id").is_in(list(overrides.keys()))
-            )
-            print(
+            # Categorical is_in compares u32 physical codes instead of
+            # strings; the StringCache context aligns the two dictionaries
+            with pl.StringCache():
+                override_ids = pl.Series(list(overrides), dtype=pl.Categorical)
+                override_results = result_df.filter(
+                    pl.col("station_id").cast(pl.Categorical).is_in(override_ids)
+                )
+            _emit(
                 override_results.select(
                     ["station_id", "lcz_code", "lcz_name", "simple_class"]
-                )
+                ),
+                args.csv,
             )
 
         except Exception as e:
@@ -147,18 +257,16 @@ def main():
             print("Error details:", str(e))
             return
     else:
-        print("Error: WUDAPT file not found at default location.")
+        print("Error: WUDAPT file not found.")
         print()
         print("To set up the WUDAPT data file:")
         print("1. Download from: https://lcz-generator.rub.de/downloads")
         print("2. Create the directory if it doesn't exist:")
-        print(f"   mkdir -p '{Path(default_path).parent}'")
+        print(f"   mkdir -p '{Path(wudapt_path).parent}'")
         print("3. Move the file to:")
-        print(f"   '{default_path}'")
+        print(f"   '{wudapt_path}'")
         print()
-        print(
-            "Alternatively, use PyUrbanClassifier('custom/path/to/file.tif') for a custom location."
-        )
+        print("Alternatively, rerun with --wudapt-path path/to/file.tif")
         return
 
     # Example 5: Working with results
@@ -181,4 +289,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except RuntimeError as e:
+        print(e)
+        sys.exit(1)
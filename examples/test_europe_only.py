@@ -1,29 +1,31 @@
 #!/usr/bin/env python3
 import polars as pl
-import urban_classifier
 
-# Test European locations only
-df = pl.DataFrame(
-    {
-        "station_id": ["HEATHROW_LHR", "LONDON_CENTER", "PARIS_CENTER"],
-        "longitude": [-0.4543, -0.1276, 2.3522],
-        "latitude": [51.47, 51.5074, 48.8566],
-    }
+from _common import POINTS, classify, get_classifier
+
+# Test European locations only. The lazy filter composes with the
+# projection inside classify(), so only the needed columns materialize.
+lf = POINTS.lazy().filter(
+    pl.col("station_id").is_in(["HEATHROW_LHR", "LONDON_CENTER", "PARIS_CENTER"])
 )
 
 print("Testing European locations with the downloaded WUDAPT file...")
 print("File size:", 1.6, "GB")
 try:
-    classifier = urban_classifier.PyUrbanClassifier("wudapt_lcz_global.tif")
-    result = classifier.run_classification(df, "station_id", "longitude", "latitude")
+    classifier = get_classifier()
+    result = classify(lf, classifier)
+
+    # Input row order is preserved by classification, so known stations can
+    # be pulled out with an O(1) row lookup instead of a predicate scan
+    station_to_idx = {sid: i for i, sid in enumerate(result["station_id"])}
     print("\nACTUAL CLASSIFICATION RESULTS:")
     print(result)
 
     print("\nHeathrow Airport Classification:")
-    heathrow = result.filter(pl.col("station_id") == "HEATHROW_LHR")
-    lcz_code = heathrow["lcz_code"][0]
-    lcz_name = heathrow["lcz_name"][0]
-    simple_class = heathrow["simple_class"][0]
+    heathrow = result.row(station_to_idx["HEATHROW_LHR"], named=True)
+    lcz_code = heathrow["lcz_code"]
+    lcz_name = heathrow["lcz_name"]
+    simple_class = heathrow["simple_class"]
 
     print(f"LCZ Code: {lcz_code}")
     print(f"LCZ Name: {lcz_name}")
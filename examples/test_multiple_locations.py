@@ -1,25 +1,20 @@
 #!/usr/bin/env python3
 import polars as pl
-import urban_classifier
 
-# Test multiple well-known locations
-df = pl.DataFrame(
-    {
-        "station_id": [
-            "HEATHROW_LHR",
-            "LONDON_CENTER",
-            "PARIS_CENTER",
-            "NYC_MANHATTAN",
-        ],
-        "longitude": [-0.4543, -0.1276, 2.3522, -73.9857],
-        "latitude": [51.47, 51.5074, 48.8566, 40.7484],
-    }
+from _common import POINTS, classify, get_classifier
+
+# Test multiple well-known locations. The lazy filter composes with the
+# projection inside classify(), so only the needed columns materialize.
+lf = POINTS.lazy().filter(
+    pl.col("station_id").is_in(
+        ["HEATHROW_LHR", "LONDON_CENTER", "PARIS_CENTER", "NYC_MANHATTAN"]
+    )
 )
 
 print("Testing multiple locations with the downloaded WUDAPT file...")
 try:
-    classifier = urban_classifier.PyUrbanClassifier("wudapt_lcz_global.tif")
-    result = classifier.run_classification(df, "station_id", "longitude", "latitude")
+    classifier = get_classifier()
+    result = classify(lf, classifier)
     print("RESULTS:")
     print(result)
 except Exception as e:
@@ -1,16 +1,15 @@
 #!/usr/bin/env python3
 import polars as pl
-import urban_classifier
+
+from _common import POINTS, classify, get_classifier
 
 # Test with the partial file anyway
-df = pl.DataFrame(
-    {"station_id": ["HEATHROW_LHR"], "longitude": [-0.4543], "latitude": [51.47]}
-)
+lf = POINTS.lazy().filter(pl.col("station_id") == "HEATHROW_LHR")
 
 print("Attempting classification with partial file...")
 try:
-    classifier = urban_classifier.PyUrbanClassifier("wudapt_lcz_global.tif")
-    result = classifier.run_classification(df, "station_id", "longitude", "latitude")
+    classifier = get_classifier()
+    result = classify(lf, classifier)
     print("SUCCESS!")
     print(result)
 except Exception as e:
@@ -26,7 +26,7 @@ use crate::spatial::{
     validate_geo_transform,
 };
 
-use gdal::Dataset;
+use gdal::{Dataset, DatasetOptions};
 use polars::prelude::*;
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
@@ -94,17 +94,56 @@ impl UrbanClassifier {
     /// # Ok::<(), Box<dyn std::error::Error>>(())
     /// ```
     pub fn new<P: AsRef<Path>>(wudapt_geotiff_path: P) -> Result<Self> {
+        Self::with_overview_level(wudapt_geotiff_path, None)
+    }
+
+    /// Create a new UrbanClassifier reading from a reduced-resolution overview
+    ///
+    /// `overview_level` is passed through as GDAL's `OVERVIEW_LEVEL` open
+    /// option: `Some(0)` exposes the first (half-resolution) overview as if
+    /// it were the full raster, `Some(1)` the quarter-resolution one, and so
+    /// on; `None` opens the full-resolution dataset, identical to `new()`.
+    /// LCZ classes are spatially coherent, so interior points classify
+    /// identically at coarse resolution while each query decodes a fraction
+    /// of the block data. Requires overviews to exist (e.g. built with
+    /// gdaladdo); production classification should use `None`.
+    ///
+    /// # Arguments
+    /// * `wudapt_geotiff_path` - Path to the WUDAPT LCZ GeoTIFF file
+    /// * `overview_level` - Optional GDAL overview level to open
+    ///
+    /// # Returns
+    /// A new UrbanClassifier instance or an error if the file cannot be opened
+    pub fn with_overview_level<P: AsRef<Path>>(
+        wudapt_geotiff_path: P,
+        overview_level: Option<u32>,
+    ) -> Result<Self> {
         let path = wudapt_geotiff_path.as_ref();
 
-        // Check if file exists
-        if !path.exists() {
+        // Check if file exists. GDAL virtual filesystem paths (e.g.
+        // /vsicurl/... for remote COGs) are not local files, so their
+        // resolution is left to GDAL.
+        let is_virtual = path.to_string_lossy().starts_with("/vsi");
+        if !is_virtual && !path.exists() {
             return Err(ClassifierError::FileNotFound {
                 path: path.to_string_lossy().to_string(),
             });
         }
 
-        // Open the dataset with GDAL
-        let dataset = Dataset::open(path)?;
+        // Open the dataset with GDAL, at the requested overview if any
+        let dataset = match overview_level {
+            None => Dataset::open(path)?,
+            Some(level) => {
+                let overview_option = format!("OVERVIEW_LEVEL={}", level);
+                Dataset::open_ex(
+                    path,
+                    DatasetOptions {
+                        open_options: Some(&[overview_option.as_str()]),
+                        ..DatasetOptions::default()
+                    },
+                )?
+            }
+        };
 
         // Validate that we have at least one raster band
         if dataset.raster_count() == 0 {
@@ -145,53 +184,22 @@ impl UrbanClassifier {
         // 1. Validate DataFrame schema
         self.validate_dataframe_schema(stations_df, station_id_col, lon_col, lat_col)?;
 
-        // 2. Get spatial reference and create coordinate transform
-        let raster_srs = self.dataset.spatial_ref()?;
-        let transform = create_wgs84_to_raster_transform(&raster_srs)?;
-
-        // 3. Get geotransform and raster band
-        let geo_transform = self.dataset.geo_transform()?;
-        let band = self.dataset.rasterband(1)?;
-
-        // 4. Extract coordinates and station IDs
+        // 2. Extract coordinates and station IDs
         let (station_ids, coordinates) =
             self.extract_coordinates(stations_df, station_id_col, lon_col, lat_col)?;
 
-        // 5. Transform coordinates and sample raster
-        let mut lcz_codes = Vec::with_capacity(coordinates.len());
-
-        for (i, (lon, lat)) in coordinates.iter().enumerate() {
-            // Transform coordinate
-            let (x, y) = transform_coordinate(*lon, *lat, &transform)?;
-
-            // Convert to pixel coordinates
-            let (pixel, line) = geo_to_pixel(x, y, &geo_transform);
-
-            // Sample raster value
-            match sample_raster_value(&band, pixel, line) {
-                Ok(code) => lcz_codes.push(code),
-                Err(e) => {
-                    return Err(ClassifierError::RasterSampling {
-                        pixel,
-                        line,
-                        message: format!(
-                            "Failed to sample raster for station {}: {}",
-                            station_ids[i], e
-                        ),
-                    });
-                }
-            }
-        }
+        // 3. Transform coordinates and sample raster
+        let mut lcz_codes = self.classify_coords(&coordinates)?;
 
-        // 6. Apply manual overrides if provided
+        // 4. Apply manual overrides if provided
         if let Some(overrides_map) = overrides {
             self.apply_overrides(&mut lcz_codes, &station_ids, overrides_map)?;
         }
 
-        // 7. Create result columns
+        // 5. Create result columns
         let lcz_series = self.create_lcz_columns(&lcz_codes)?;
 
-        // 8. Return enhanced DataFrame
+        // 6. Return enhanced DataFrame
         let mut result_df = stations_df.clone();
         for series in lcz_series {
             result_df = result_df.with_column(series)?.clone();
@@ -200,6 +208,73 @@ impl UrbanClassifier {
         Ok(result_df)
     }
 
+    /// Classify a batch of WGS84 coordinates directly, without DataFrame overhead
+    ///
+    /// This is the core lookup used by `run_classification`. Accepting the whole
+    /// batch as a slice lets callers (notably the Python bindings) hand over all
+    /// coordinates in a single call instead of crossing the boundary per point.
+    ///
+    /// # Arguments
+    /// * `coordinates` - Slice of (longitude, latitude) pairs in WGS84
+    ///
+    /// # Returns
+    /// Vector of LCZ codes in the same order as the input coordinates
+    pub fn classify_coords(&self, coordinates: &[(f64, f64)]) -> Result<Vec<u8>> {
+        // Get spatial reference and create coordinate transform
+        let raster_srs = self.dataset.spatial_ref()?;
+        let transform = create_wgs84_to_raster_transform(&raster_srs)?;
+
+        // Get the geotransform for the inverse affine
+        let geo_transform = self.dataset.geo_transform()?;
+
+        // Transform all coordinates to pixel positions first
+        let mut pixels = Vec::with_capacity(coordinates.len());
+        for (lon, lat) in coordinates {
+            let (x, y) = transform_coordinate(*lon, *lat, &transform)?;
+            pixels.push(geo_to_pixel(x, y, &geo_transform));
+        }
+
+        self.classify_pixels(&pixels)
+    }
+
+    /// Sample the raster at pre-computed pixel positions
+    ///
+    /// Callers that have already applied the inverse geotransform themselves
+    /// (e.g. a vectorized numpy affine over a large batch) can skip the
+    /// per-point CRS and geotransform work and sample directly. Sampling
+    /// happens in raster-block order, with values scattered back into input
+    /// order, exactly as in `classify_coords`.
+    ///
+    /// # Arguments
+    /// * `pixels` - Slice of (pixel, line) raster positions
+    ///
+    /// # Returns
+    /// Vector of LCZ codes in the same order as the input positions
+    pub fn classify_pixels(&self, pixels: &[(isize, isize)]) -> Result<Vec<u8>> {
+        let band = self.dataset.rasterband(1)?;
+
+        // Sample in raster-block order so consecutive reads hit the same
+        // cached block, then scatter the values back into input order
+        let order = block_sorted_order(pixels, band.block_size());
+
+        let mut lcz_codes = vec![0u8; pixels.len()];
+        for i in order {
+            let (pixel, line) = pixels[i];
+            lcz_codes[i] = sample_raster_value(&band, pixel, line)?;
+        }
+
+        Ok(lcz_codes)
+    }
+
+    /// The dataset's affine geotransform
+    ///
+    /// Returned as `[x_origin, pixel_width, x_skew, y_origin, y_skew,
+    /// pixel_height]`, the layout GDAL uses. Callers can apply the inverse
+    /// transform in bulk and feed the result to `classify_pixels`.
+    pub fn geo_transform(&self) -> Result<[f64; 6]> {
+        Ok(self.dataset.geo_transform()?)
+    }
+
     /// Validate that the input DataFrame has required columns with correct types
     fn validate_dataframe_schema(
         &self,
@@ -341,6 +416,25 @@ impl UrbanClassifier {
     }
 }
 
+/// Compute the order in which to sample pixel positions so that positions
+/// falling in the same raster block are visited consecutively
+///
+/// GDAL caches decompressed blocks, so visiting pixels in arbitrary
+/// geographic order can evict and re-read the same block repeatedly. Sorting
+/// by (block row, block column) turns the accesses into a sequential scan of
+/// the block cache. The returned vector is a permutation of input indices.
+fn block_sorted_order(pixels: &[(isize, isize)], block_size: (usize, usize)) -> Vec<usize> {
+    let (block_w, block_h) = (block_size.0.max(1) as isize, block_size.1.max(1) as isize);
+
+    let mut order: Vec<usize> = (0..pixels.len()).collect();
+    order.sort_by_key(|&i| {
+        let (pixel, line) = pixels[i];
+        (line.div_euclid(block_h), pixel.div_euclid(block_w))
+    });
+
+    order
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -405,6 +499,30 @@ mod tests {
         assert_eq!(Lcz::from_code(11).simple_category().as_ref(), "Rural");
     }
 
+    /// Test that block-sorted ordering groups pixels by raster block
+    #[test]
+    fn test_block_sorted_order() {
+        // Three pixels in block (0, 0), one in block (1, 0), one in block (0, 1)
+        // for a 512x512 block size
+        let pixels = [(600, 10), (5, 5), (10, 600), (100, 100), (511, 511)];
+
+        let order = block_sorted_order(&pixels, (512, 512));
+
+        // A valid permutation of all indices
+        let mut sorted = order.clone();
+        sorted.sort_unstable();
+        assert_eq!(sorted, vec![0, 1, 2, 3, 4]);
+
+        // Pixels in block row 0: indices 0, 1, 3, 4; block row 1: index 2.
+        // Within block row 0, block column 0 (indices 1, 3, 4) precedes
+        // block column 1 (index 0).
+        assert_eq!(order[3], 0);
+        assert_eq!(order[4], 2);
+
+        // Sort must be stable for same-block pixels (input order preserved)
+        assert_eq!(&order[..3], &[1, 3, 4]);
+    }
+
     /// Test default data path functionality
     #[test]
     fn test_default_data_path() {
@@ -19,6 +19,7 @@
 
 #![allow(non_local_definitions)]
 
+use numpy::{PyReadonlyArray1, PyReadonlyArray2};
 use pyo3::prelude::*;
 use pyo3::types::PyType;
 use pyo3_polars::PyDataFrame;
@@ -36,12 +37,12 @@ pub struct PyUrbanClassifier {
 #[pymethods]
 impl PyUrbanClassifier {
     #[new]
-    fn new(wudapt_path: Option<&str>) -> PyResult<Self> {
-        let inner = match wudapt_path {
-            Some(path) => UrbanClassifier::new(path),
-            None => UrbanClassifier::from_default_data(),
-        }
-        .map_err(convert_classifier_error_to_py)?;
+    fn new(wudapt_path: Option<&str>, overview_level: Option<u32>) -> PyResult<Self> {
+        let path = wudapt_path
+            .map(std::path::PathBuf::from)
+            .unwrap_or_else(UrbanClassifier::default_data_path);
+        let inner = UrbanClassifier::with_overview_level(path, overview_level)
+            .map_err(convert_classifier_error_to_py)?;
         Ok(PyUrbanClassifier { inner })
     }
 
@@ -101,6 +102,97 @@ impl PyUrbanClassifier {
         Ok(PyDataFrame(result_df))
     }
 
+    /// Classify a batch of coordinates given as an (N, 2) array of (lon, lat).
+    ///
+    /// This is the lowest-overhead entry point: the whole batch crosses the
+    /// Python/Rust boundary in one call, so callers should gather their
+    /// coordinates into a single contiguous float64 array, e.g. via
+    /// `df.select(["longitude", "latitude"]).to_numpy()`.
+    ///
+    /// Parameters:
+    /// - coords: numpy array of shape (N, 2) with columns (longitude, latitude)
+    ///
+    /// Returns:
+    /// List of LCZ codes, one per input row, in input order
+    fn classify_points(&self, coords: PyReadonlyArray2<'_, f64>) -> PyResult<Vec<u32>> {
+        let coords = coords.as_array();
+
+        if coords.ncols() != 2 {
+            return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "Expected coordinate array of shape (N, 2), got (N, {})",
+                coords.ncols()
+            )));
+        }
+
+        let pairs: Vec<(f64, f64)> = coords
+            .rows()
+            .into_iter()
+            .map(|row| (row[0], row[1]))
+            .collect();
+
+        let codes = self
+            .inner
+            .classify_coords(&pairs)
+            .map_err(convert_classifier_error_to_py)?;
+
+        Ok(codes.into_iter().map(u32::from).collect())
+    }
+
+    /// Classify a batch of pre-computed raster pixel positions.
+    ///
+    /// For callers that have already applied the inverse geotransform in
+    /// bulk (e.g. a vectorized numpy affine over the arrays returned by
+    /// `geo_transform()`), this skips the per-point CRS and geotransform
+    /// work entirely. Use `classify_points` unless you know the raster is
+    /// north-up WGS84 and the batch is large enough to matter.
+    ///
+    /// Parameters:
+    /// - cols: numpy int64 array of pixel (column) indices
+    /// - rows: numpy int64 array of line (row) indices
+    ///
+    /// Returns:
+    /// List of LCZ codes, one per input position, in input order
+    fn classify_pixels(
+        &self,
+        cols: PyReadonlyArray1<'_, i64>,
+        rows: PyReadonlyArray1<'_, i64>,
+    ) -> PyResult<Vec<u32>> {
+        let cols = cols.as_array();
+        let rows = rows.as_array();
+
+        if cols.len() != rows.len() {
+            return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                "cols and rows must have the same length, got {} and {}",
+                cols.len(),
+                rows.len()
+            )));
+        }
+
+        let pixels: Vec<(isize, isize)> = cols
+            .iter()
+            .zip(rows.iter())
+            .map(|(&col, &row)| (col as isize, row as isize))
+            .collect();
+
+        let codes = self
+            .inner
+            .classify_pixels(&pixels)
+            .map_err(convert_classifier_error_to_py)?;
+
+        Ok(codes.into_iter().map(u32::from).collect())
+    }
+
+    /// The dataset's affine geotransform.
+    ///
+    /// Returns:
+    /// List [x_origin, pixel_width, x_skew, y_origin, y_skew, pixel_height]
+    /// in GDAL's layout, suitable for a vectorized inverse transform.
+    fn geo_transform(&self) -> PyResult<[f64; 6]> {
+        self.inner
+            .geo_transform()
+            .map_err(convert_classifier_error_to_py)
+    }
+
     /// Get information about the LCZ classification system.
     ///
     /// Returns a dictionary containing: